@@ -17,7 +17,11 @@
 
 # %%
 # Load input data
+import mmap
+import multiprocessing
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 
 if os.path.exists("../resources/inputs/day06.txt"):
     with open("../resources/inputs/day06.txt", "r") as f:
@@ -43,10 +47,39 @@ example_input_1 = """123 328  51 64
 
 
 # %%
-# Helper function: Apply operation to list of numbers
+# Helper functions: Reduce a problem's numbers with its operator
+def product_tree(numbers):
+    """
+    Multiply numbers with a balanced pairwise product tree.
+
+    Multiplying left to right makes one operand grow while the other stays
+    small, which is quadratic for big ints. Pairing neighbours level by
+    level keeps both operands of each multiplication about the same size.
+
+    Args:
+        numbers: List of integers
+
+    Returns:
+        Product of all numbers (1 for an empty list)
+    """
+    level = list(numbers)
+    if not level:
+        return 1
+
+    while len(level) > 1:
+        paired = [level[i] * level[i + 1] for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+
+    return level[0]
+
+
 def apply_operation(numbers, operator):
     """
-    Apply an operation to a list of numbers sequentially.
+    Apply an operation to a list of numbers.
+
+    Uses sum() for '+' and a balanced product tree for '*'.
 
     Args:
         numbers: List of integers
@@ -58,14 +91,12 @@ def apply_operation(numbers, operator):
     if not numbers:
         return 0
 
-    result = numbers[0]
-    for num in numbers[1:]:
-        if operator == "+":
-            result += num
-        elif operator == "*":
-            result *= num
+    if operator == "+":
+        return sum(numbers)
+    elif operator == "*":
+        return product_tree(numbers)
 
-    return result
+    return numbers[0]
 
 
 # %%
@@ -111,6 +142,124 @@ def solve_part1(data):
     return grand_total
 
 
+# %%
+# Part 1: Streaming solution for very wide worksheets
+NUMBER_PATTERN = re.compile(rb"\d+")
+OPERATOR_PATTERN = re.compile(rb"[+*]")
+
+
+def find_row_spans(mm):
+    """
+    Locate every row of a memory-mapped worksheet.
+
+    Args:
+        mm: Memory-mapped worksheet file
+
+    Returns:
+        List of (offset, length) tuples, one per row
+    """
+    spans = []
+    pos = 0
+    while pos < len(mm):
+        line_end = mm.find(b"\n", pos)
+        if line_end == -1:
+            line_end = len(mm)
+        spans.append((pos, line_end - pos))
+        pos = line_end + 1
+    return spans
+
+
+def find_operator_row(mm, row_spans):
+    """
+    Find the operator row by scanning back from the end of the worksheet.
+
+    Args:
+        mm: Memory-mapped worksheet file
+        row_spans: (offset, length) of each row, from find_row_spans
+
+    Returns:
+        Index of the last row containing an operator, or None
+    """
+    for row_idx in range(len(row_spans) - 1, -1, -1):
+        offset, length = row_spans[row_idx]
+        if OPERATOR_PATTERN.search(mm, offset, offset + length):
+            return row_idx
+    return None
+
+
+def sum_part1_columns(mm, row_spans, operator_row, start_col, end_col):
+    """
+    Evaluate the Part 1 problems lying between two separator columns.
+
+    The operators are read first, then the number rows are streamed token
+    by token into one running sum or product per problem.
+
+    Args:
+        mm: Memory-mapped worksheet file
+        row_spans: (offset, length) of each row, from find_row_spans
+        operator_row: Index of the operator row, from find_operator_row
+        start_col: First column of the range
+        end_col: Column to stop before
+
+    Returns:
+        Sum of the results of the problems in the range
+    """
+    offset, length = row_spans[operator_row]
+    operators = [
+        m.group()
+        for m in OPERATOR_PATTERN.finditer(
+            mm, offset + start_col, offset + min(end_col, length)
+        )
+    ]
+    totals = [0 if op == b"+" else 1 for op in operators]
+
+    # Stream the number rows, updating each problem's running total
+    for offset, length in row_spans[:operator_row]:
+        tokens = NUMBER_PATTERN.finditer(
+            mm, offset + start_col, offset + min(end_col, length)
+        )
+        for prob_idx, (match, op) in enumerate(zip(tokens, operators)):
+            if op == b"+":
+                totals[prob_idx] += int(match.group())
+            else:
+                totals[prob_idx] *= int(match.group())
+
+    return sum(totals)
+
+
+def solve_part1_from_file(path, workers=1):
+    """
+    Solve Part 1 straight from a worksheet file without tokenizing every row.
+
+    The operator row comes last, so it is read first by scanning back from
+    the end of the memory-mapped file. The number rows are then streamed
+    token by token into one running sum or product per problem, keeping
+    memory at O(number of problems) instead of O(total tokens).
+
+    Args:
+        path: Path to the worksheet file
+        workers: Number of processes; above 1 the problems are split into
+            column ranges and evaluated in a process pool
+
+    Returns:
+        Grand total (sum of all problem results)
+    """
+    if os.path.getsize(path) == 0:
+        return 0
+
+    if workers > 1:
+        return evaluate_file_in_pool(path, 1, workers)
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        row_spans = find_row_spans(mm)
+        operator_row = find_operator_row(mm, row_spans)
+        if operator_row is None:
+            return 0
+
+        max_len = max(length for _, length in row_spans)
+        return sum_part1_columns(mm, row_spans, operator_row, 0, max_len)
+
+
 # %%
 # Part 1: Test with example
 result_example_1 = solve_part1(example_input_1)
@@ -160,12 +309,128 @@ example_input_2 = """123 328  51 64
 *   +   *   +  """
 
 
+# %%
+# Helper functions: Column-major parsing of the padded worksheet
+def find_separator_columns(rows):
+    """
+    Build a mask marking the blank separator columns of the worksheet.
+
+    All rows are OR-ed together as big integers in one pass. A space is
+    0x20, and any digit or operator OR-ed with a space is something else,
+    so a byte of the combined row is 0x20 only where every row is blank.
+
+    Args:
+        rows: List of equal-length byte strings (the padded worksheet)
+
+    Returns:
+        Bytes of the row width; 0x20 marks a separator column
+    """
+    combined = 0
+    for row in rows:
+        combined |= int.from_bytes(row, "big")
+    return combined.to_bytes(len(rows[0]), "big")
+
+
+def iter_vertical_problems(blocks):
+    """
+    Parse the padded worksheet column by column into problems.
+
+    Each column is visited once with zip(*rows). Vertical numbers are built
+    digit by digit (n = n * 10 + d) without joining or re-parsing strings.
+    The worksheet may arrive as several blocks of adjacent columns; a
+    problem that straddles two blocks is carried over to the next one.
+
+    Args:
+        blocks: Iterable of blocks, each a list of equal-length byte strings
+            holding consecutive columns of every row, left to right
+
+    Yields:
+        (numbers, operator) tuples, one per problem
+    """
+    numbers = []
+    operator = None
+
+    for rows in blocks:
+        separators = find_separator_columns(rows)
+
+        for is_blank, column in zip(separators, zip(*rows)):
+            if is_blank == 0x20:
+                # Separator column closes the current problem
+                if numbers:
+                    yield numbers, operator
+                numbers = []
+                operator = None
+                continue
+
+            number = 0
+            has_digit = False
+            for byte in column:
+                if 0x30 <= byte <= 0x39:
+                    number = number * 10 + (byte - 0x30)
+                    has_digit = True
+                elif byte == 0x2B or byte == 0x2A:
+                    operator = chr(byte)
+
+            if has_digit:
+                numbers.append(number)
+
+    # Don't forget last problem
+    if numbers:
+        yield numbers, operator
+
+
+def parse_vertical_problems(rows):
+    """
+    Parse an in-memory padded worksheet into (numbers, operator) problems.
+
+    Args:
+        rows: List of equal-length byte strings (the padded worksheet)
+
+    Returns:
+        List of (numbers, operator) tuples, one per problem
+    """
+    return list(iter_vertical_problems([rows]))
+
+
+def iter_column_blocks(mm, row_spans, start_col, end_col, block_width):
+    """
+    Read a memory-mapped worksheet one block of columns at a time.
+
+    Only the bytes of each row that fall inside the current block are read,
+    padded with spaces where a row is shorter than the block.
+
+    Args:
+        mm: Memory-mapped worksheet file
+        row_spans: (offset, length) of each row, from find_row_spans
+        start_col: First column to read
+        end_col: Column to stop before
+        block_width: Number of columns per block
+
+    Yields:
+        Lists of equal-length byte strings, one per row
+    """
+    for block_start in range(start_col, end_col, block_width):
+        block_end = min(block_start + block_width, end_col)
+        width = block_end - block_start
+        yield [
+            (
+                mm[offset + block_start : offset + min(block_end, length)].ljust(width)
+                if length > block_start
+                else b" " * width
+            )
+            for offset, length in row_spans
+        ]
+
+
 # %%
 # Part 2: Solution function
 def solve_part2(data):
     """
     Solve the math worksheet reading right-to-left with vertical numbers.
 
+    Both operations are order-independent, so columns are read left-to-right
+    in a single pass; see parse_vertical_problems.
+
     Args:
         data: Input data as string (multi-line worksheet)
 
@@ -176,67 +441,71 @@ def solve_part2(data):
 
     # Pad all lines to same length
     max_len = max(len(line) for line in lines)
-    lines = [line.ljust(max_len) for line in lines]
+    rows = [line.ljust(max_len).encode() for line in lines]
 
-    # Process columns right-to-left
-    problems = []
-    current_problem = []
+    grand_total = 0
 
-    for col_idx in range(max_len - 1, -1, -1):
-        # Extract column
-        column = "".join(line[col_idx] for line in lines)
+    for numbers, operator in parse_vertical_problems(rows):
+        if operator:
+            grand_total += apply_operation(numbers, operator)
 
-        # Check if empty column (separator)
-        if column.strip() == "":
-            if current_problem:
-                problems.append(current_problem)
-                current_problem = []
-        else:
-            # Add to current problem (we'll reverse later since we're going right-to-left)
-            current_problem.append(column)
+    return grand_total
 
-    # Don't forget last problem
-    if current_problem:
-        problems.append(current_problem)
 
-    # Solve each problem
+# %%
+# Part 2: Memory-mapped solution for very wide worksheets
+def sum_part2_columns(mm, row_spans, start_col, end_col, block_width):
+    """
+    Evaluate the Part 2 problems lying between two separator columns.
+
+    Args:
+        mm: Memory-mapped worksheet file
+        row_spans: (offset, length) of each row, from find_row_spans
+        start_col: First column of the range
+        end_col: Column to stop before
+        block_width: Number of columns read from each row per block
+
+    Returns:
+        Sum of the results of the problems in the range
+    """
+    blocks = iter_column_blocks(mm, row_spans, start_col, end_col, block_width)
+
     grand_total = 0
 
-    for problem_cols in problems:
-        # Reverse columns since we collected them right-to-left
-        problem_cols = problem_cols[::-1]
+    for numbers, operator in iter_vertical_problems(blocks):
+        if operator:
+            grand_total += apply_operation(numbers, operator)
 
-        # Extract numbers and operator from columns
-        numbers = []
-        operator = None
+    return grand_total
 
-        for col in problem_cols:
-            # Strip the column first, then check last char
-            col_stripped = col.strip()
 
-            if not col_stripped:
-                continue
+def solve_part2_from_file(path, block_width=1 << 16, workers=1):
+    """
+    Solve Part 2 straight from a worksheet file, one block of columns at a time.
 
-            # Last character should be from operator row
-            last_char = col_stripped[-1]
+    The file is memory-mapped and only block_width columns of each row are
+    read at once, so peak memory is one block rather than a padded copy of
+    the whole worksheet.
 
-            if last_char in "+*":
-                # This column has the operator
-                operator = last_char
-                # Number is formed from all characters except operator
-                number_chars = col_stripped[:-1]
-                if number_chars:
-                    numbers.append(int(number_chars))
-            else:
-                # Regular number column - all digits
-                numbers.append(int(col_stripped))
+    Args:
+        path: Path to the worksheet file
+        block_width: Number of columns read from each row per block
+        workers: Number of processes; above 1 the problems are split into
+            column ranges and evaluated in a process pool
 
-        # Calculate result
-        if operator and numbers:
-            result = apply_operation(numbers, operator)
-            grand_total += result
+    Returns:
+        Grand total (sum of all problem results)
+    """
+    if os.path.getsize(path) == 0:
+        return 0
 
-    return grand_total
+    if workers > 1:
+        return evaluate_file_in_pool(path, 2, workers, block_width)
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        row_spans = find_row_spans(mm)
+        max_len = max(length for _, length in row_spans)
+        return sum_part2_columns(mm, row_spans, 0, max_len, block_width)
 
 
 # %%
@@ -250,3 +519,95 @@ print(f"Expected: 3263827")
 if puzzle_input:
     result_part2 = solve_part2(puzzle_input)
     print(f"\nPart 2 Answer: {result_part2}")
+
+# %% [markdown]
+# ## Parallel Evaluation of Huge Worksheets
+#
+# Problems are independent once the separator columns are known, so the
+# worksheet is cut into contiguous column ranges at separator columns.
+# Each worker maps the same input file, reads only its own columns and
+# returns a partial grand total.
+#
+# This module reads and solves the puzzle input when imported, and workers
+# started with spawn or forkserver (the defaults on Windows, macOS and, from
+# Python 3.14, Linux) re-import it, redoing that work before their own range.
+# The pool is therefore always started with fork. Where fork isn't available
+# (Windows), the ranges are evaluated one after another in this process.
+
+
+# %%
+def find_next_separator(mm, row_spans, start_col, end_col, block_width):
+    """Return the first separator column in [start_col, end_col), or None."""
+    blocks = iter_column_blocks(mm, row_spans, start_col, end_col, block_width)
+    for block_idx, rows in enumerate(blocks):
+        idx = find_separator_columns(rows).find(b" ")
+        if idx != -1:
+            return start_col + block_idx * block_width + idx
+    return None
+
+
+def split_column_ranges(mm, row_spans, max_len, parts, block_width):
+    """
+    Cut the worksheet into about `parts` column ranges at separator columns.
+
+    Returns:
+        List of (start_col, end_col) tuples covering [0, max_len)
+    """
+    bounds = [0]
+    for part_idx in range(1, parts):
+        target = max(part_idx * max_len // parts, bounds[-1] + 1)
+        cut = find_next_separator(mm, row_spans, target, max_len, block_width)
+        if cut is None:
+            break
+        bounds.append(cut)
+    bounds.append(max_len)
+    return list(zip(bounds, bounds[1:]))
+
+
+def evaluate_column_range(
+    path, part, row_spans, operator_row, start_col, end_col, block_width
+):
+    """Worker: map the input file and total the problems in one column range."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if part == 1:
+            return sum_part1_columns(mm, row_spans, operator_row, start_col, end_col)
+        return sum_part2_columns(mm, row_spans, start_col, end_col, block_width)
+
+
+def evaluate_file_in_pool(path, part, workers, block_width=1 << 16):
+    """
+    Solve one part of a worksheet file using a process pool.
+    Workers are forked (see above); without fork, the ranges run serially.
+
+    Args:
+        path: Path to the worksheet file
+        part: 1 or 2
+        workers: Number of worker processes
+        block_width: Number of columns read from each row per block
+
+    Returns:
+        Grand total (sum of all problem results)
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        row_spans = find_row_spans(mm)
+        operator_row = find_operator_row(mm, row_spans)
+        if part == 1 and operator_row is None:
+            return 0
+
+        max_len = max(length for _, length in row_spans)
+        ranges = split_column_ranges(mm, row_spans, max_len, workers, block_width)
+
+    args = [
+        (path, part, row_spans, operator_row, start_col, end_col, block_width)
+        for start_col, end_col in ranges
+    ]
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return sum(evaluate_column_range(*range_args) for range_args in args)
+
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [
+            pool.submit(evaluate_column_range, *range_args) for range_args in args
+        ]
+        return sum(future.result() for future in futures)
@@ -10,12 +10,19 @@
 # **Part 2:** Count total timelines (many-worlds interpretation - each split creates 2 universes).
 #
 # **Approach:**
-# - Part 1: Recursive search with memoization to track visited splitters
-# - Part 2: Recursive search counting timeline multiplier from each position
+# - Store only the splitters; find the next one below a beam with bisect
+# - Jump from splitter to splitter in row order (a heap of pending rows),
+#   keeping the number of beams waiting at each splitter
+# - Part 1: Count splitters that have at least one beam on them
+# - Part 2: Count timelines as the total beam count leaving the manifold
 
 # %%
 # Load input data
+import heapq
+import math
+import operator
 import os
+from bisect import bisect_left
 
 if os.path.exists("../resources/inputs/day07.txt"):
     with open("../resources/inputs/day07.txt", "r") as f:
@@ -26,89 +33,221 @@ elif os.path.exists("resources/inputs/day07.txt"):
 else:
     puzzle_input = ""  # Will be loaded when needed
 
+# %% [markdown]
+# ## Counting Modes
+#
+# Timeline counts grow exponentially with depth, so exact totals on large
+# manifolds are huge Python ints. When the exact value isn't needed:
+# - `modulus`: exact count modulo a (prime) modulus; values stay word-sized
+# - `log2`: approximate log2 of the count as a float
+
+
+# %%
+def timeline_arithmetic(modulus=None, log2=False):
+    """
+    Return (zero, one, add) for counting timelines in the chosen mode.
+    Default is exact Python ints.
+    """
+    if modulus is not None and log2:
+        raise ValueError("Choose either modulus or log2, not both")
+
+    if modulus is not None:
+        return 0, 1 % modulus, lambda a, b: (a + b) % modulus
+
+    if log2:
+
+        def log2_add(a, b):
+            """log2(2**a + 2**b) without leaving float range."""
+            hi, lo = (a, b) if a >= b else (b, a)
+            if lo == -math.inf:
+                return hi
+            return hi + math.log2(1 + 2.0 ** (lo - hi))
+
+        return -math.inf, 0.0, log2_add
+
+    return 0, 1, operator.add
+
+
 # %% [markdown]
 # ## Grid Class
 #
 # Manages the tachyon manifold grid and beam traversal logic.
-# - `count_splits()`: Part 1 - count unique splitters with deduplication
-# - `count_timelines()`: Part 2 - count total universes with memoization
+# Only splitters are stored: a sorted list of splitter rows per column,
+# so memory is O(splitters) and the next splitter below a beam is a bisect.
+# - `next_splitter()`: first splitter at or below a row in a column
+# - `sweep()`: beam counts visiting only the splitters beams reach
+# - `count_splits()`: Part 1 - count unique splitters hit
+# - `count_splits_bitwise()`: Part 1 - one big-int beam mask per row
+# - `count_timelines()`: Part 2 - count total universes
+# - `timelines_by_column()`: Part 2 for every entry column in one bottom-up pass
 
 
 # %%
 class Grid:
     def __init__(self, lines):
-        self.grid = [list(line) for line in lines]
-        self.height = len(self.grid)
-        self.width = len(self.grid[0]) if self.grid else 0
-        self.split_splitters = set()  # Track unique splitters that have been hit
+        self.height = len(lines)
+        self.width = len(lines[0]) if lines else 0
+        self.start = None  # (row, col) of S
+        self.column_splitters = {}  # col -> sorted rows of its splitters
+        self.row_splitters = {}  # row -> sorted cols of its splitters
+
+        for row, line in enumerate(lines):
+            if self.start is None:
+                col = line.find("S")
+                if col != -1:
+                    self.start = (row, col)
+
+            col = line.find("^")
+            while col != -1:
+                self.column_splitters.setdefault(col, []).append(row)
+                self.row_splitters.setdefault(row, []).append(col)
+                col = line.find("^", col + 1)
 
     def find_start(self):
         """Find the S position and return its column index."""
-        for row in range(self.height):
-            for col in range(self.width):
-                if self.grid[row][col] == "S":
-                    return col
-        return None
+        if self.start is None:
+            return None
+        return self.start[1]
+
+    def next_splitter(self, col, row):
+        """Return the row of the first splitter at or below row in col, or None."""
+        rows = self.column_splitters.get(col)
+        if not rows:
+            return None
+        idx = bisect_left(rows, row)
+        return rows[idx] if idx < len(rows) else None
+
+    def splitter_mask(self, row):
+        """Return the splitters of a row as an int with bit c set for column c."""
+        digits = bytearray(b"0" * self.width)
+        for col in self.row_splitters.get(row, ()):
+            digits[self.width - 1 - col] = ord("1")
+        return int(digits, 2)
+
+    def sweep(self, start_row, col, modulus=None, log2=False):
+        """
+        Sweep a beam down the manifold, jumping from splitter to splitter.
+        Keeps the number of timelines (beams) waiting at each splitter, and
+        handles splitters in row order. When beams reach a splitter, they move
+        to the columns on either side and continue from the next row. Beams
+        leaving the sides or the bottom end their timeline.
+        Assumes splitters are never side by side in a row, as in puzzle inputs.
+
+        Returns: (unique splitters hit, total timelines). Cost depends on the
+        number of splitters reached, with no recursion or memo dict.
+        Timelines are counted in the mode given by modulus/log2 (see
+        timeline_arithmetic).
+        """
+        zero, one, add = timeline_arithmetic(modulus, log2)
+
+        # Bounds check - beam exits manifold
+        if col < 0 or col >= self.width:
+            return 0, one
+
+        first = self.next_splitter(col, start_row)
+        if first is None:
+            return 0, one
+
+        pending = {first: {col: one}}  # row -> {col: beams waiting at splitter}
+        rows = [first]  # heap of rows with pending splitters
+        exited = zero
+        splits = 0
+
+        while rows:
+            row = heapq.heappop(rows)
+
+            for c, count in pending.pop(row).items():
+                # Each splitter with beams on it counts once, however many beams
+                splits += 1
+                for side in (c - 1, c + 1):
+                    below = None
+                    if 0 <= side < self.width:
+                        below = self.next_splitter(side, row + 1)
+
+                    if below is None:
+                        exited = add(exited, count)
+                        continue
+
+                    if below not in pending:
+                        pending[below] = {}
+                        heapq.heappush(rows, below)
+                    beams = pending[below]
+                    beams[side] = add(beams[side], count) if side in beams else count
+
+        return splits, exited
 
     def count_splits(self, start_row, col):
+        """Count unique splitters hit by a beam starting at (start_row, col)."""
+        splits, _ = self.sweep(start_row, col)
+        return splits
+
+    def count_splits_bitwise(self, start_row, col):
         """
-        Count beam splits recursively.
-        Search straight down from start_row in this column.
-        If splitter (^) found, count it and recursively check left and right beams.
-        Track unique splitters to avoid double-counting when beams converge.
+        Count unique splitters hit, treating each row as a few big-int operations.
+        The active beam columns are one int (bit c = column c), and so are the
+        splitters of each row. Beams on a splitter shift one bit left and right;
+        bits shifted past either edge leave the manifold.
         """
         # Bounds check
         if col < 0 or col >= self.width:
             return 0
 
-        # Search down from start_row in this column
-        for row in range(start_row, self.height):
-            if self.grid[row][col] == "^":
-                # Found a splitter! Check if we've already split it
-                if (row, col) in self.split_splitters:
-                    return 0
+        full = (1 << self.width) - 1
+        beams = 1 << col
+        splits = 0
 
-                # Mark this splitter as split
-                self.split_splitters.add((row, col))
+        # row_splitters was filled top to bottom, so rows come in order
+        for row in self.row_splitters:
+            if row < start_row:
+                continue
 
-                # Count this split plus recursive splits from left and right
-                left_splits = self.count_splits(row, col - 1)
-                right_splits = self.count_splits(row, col + 1)
-                return 1 + left_splits + right_splits
+            hit = beams & self.splitter_mask(row)
+            if hit:
+                splits += hit.bit_count()
+                beams = ((beams & ~hit) | (hit << 1) | (hit >> 1)) & full
 
-        # No splitter found in this column below start_row
-        return 0
+        return splits
 
-    def count_timelines(self, start_row, col, memo):
+    def count_timelines(self, start_row, col, modulus=None, log2=False):
         """
         Count total timelines (universes) from this position.
-        Uses memoization to cache results for (start_row, col) positions.
-
-        Returns: Number of timelines that emerge from a beam starting at this position.
         - If no splitter: 1 timeline (beam exits)
         - If splitter at row R: left_timelines + right_timelines
+        Pass modulus or log2 for a modular or approximate log2 count.
         """
-        # Bounds check - beam exits manifold
-        if col < 0 or col >= self.width:
-            return 1  # This timeline completes
+        _, timelines = self.sweep(start_row, col, modulus, log2)
+        return timelines
+
+    def timelines_by_column(self, start_row=0, modulus=None, log2=False):
+        """
+        Count timelines for a beam entering at every column of start_row.
+        One bottom-up pass over the splitter rows: below[c] holds the timelines
+        of a beam in column c under the current row. A splitter at (row, c)
+        replaces it with the sum of its neighbours (1 past either edge).
+        Pass modulus or log2 for a modular or approximate log2 count.
+
+        Returns: list of length self.width, so N entry columns cost one pass.
+        """
+        _, one, add = timeline_arithmetic(modulus, log2)
+        below = [one] * self.width
 
-        # Check memo
-        if (start_row, col) in memo:
-            return memo[(start_row, col)]
+        # row_splitters was filled top to bottom, so reversed() goes bottom-up
+        for row in reversed(self.row_splitters):
+            if row < start_row:
+                break
 
-        # Search down from start_row in this column
-        for row in range(start_row, self.height):
-            if self.grid[row][col] == "^":
-                # Found a splitter! Timeline splits into left and right
-                left_timelines = self.count_timelines(row, col - 1, memo)
-                right_timelines = self.count_timelines(row, col + 1, memo)
-                result = left_timelines + right_timelines
-                memo[(start_row, col)] = result
-                return result
+            cols = self.row_splitters[row]
+            split = [
+                add(
+                    below[c - 1] if c > 0 else one,
+                    below[c + 1] if c + 1 < self.width else one,
+                )
+                for c in cols
+            ]
+            for c, timelines in zip(cols, split):
+                below[c] = timelines
 
-        # No splitter found - beam exits at bottom
-        memo[(start_row, col)] = 1
-        return 1
+        return below
 
 
 # %% [markdown]
@@ -116,15 +255,19 @@ class Grid:
 #
 # **Algorithm:**
 # 1. Start beam at column S, row 0
-# 2. Search downward for splitter (^)
-# 3. When found, recursively search left (col-1) and right (col+1) from that row
-# 4. Track visited splitters to avoid double-counting when beams converge
+# 2. Jump to the first splitter below it in its column (bisect)
+# 3. Take pending splitters in row order from a heap; each one is counted and
+#    sends beams to the next splitter below in the columns left and right
+# 4. Converging beams wait at the same splitter, so each one is counted once
 # 5. Return total count of unique splitters hit
 
 
 # %%
-def solve_part1(data):
-    """Count how many times the beam is split."""
+def solve_part1(data, bitwise=False):
+    """
+    Count how many times the beam is split.
+    With bitwise=True, use the bit-parallel row sweep (fast on very wide manifolds).
+    """
     lines = [line for line in data.split("\n") if line]
 
     grid = Grid(lines)
@@ -134,7 +277,10 @@ def solve_part1(data):
         return 0
 
     # Start searching from row 0 at the S column
-    total_splits = grid.count_splits(0, start_col)
+    if bitwise:
+        total_splits = grid.count_splits_bitwise(0, start_col)
+    else:
+        total_splits = grid.count_splits(0, start_col)
 
     return total_splits
 
@@ -172,26 +318,31 @@ print(f"Part 1 Answer: {part1_answer}")
 #
 # **Algorithm:**
 # 1. Each splitter creates 2 universes (left and right paths)
-# 2. Count total universes by tracking timeline multiplier from each position
-# 3. Use memoization: cache (start_row, col) -> timeline_count
-# 4. When beam exits (bounds or bottom): contributes 1 timeline
-# 5. When beam hits splitter: contributes left_timelines + right_timelines
+# 2. Same splitter-to-splitter sweep as Part 1, keeping a timeline count per
+#    pending splitter
+# 3. When beams hit a splitter: add their count to the next splitters below
+#    in both neighbouring columns
+# 4. When beams exit (sides or bottom): their count adds to the total
+# 5. Total timelines = sum of all exiting counts
 
 
 # %%
-def solve_part2(data):
-    """Count total timelines (many-worlds interpretation)."""
+def solve_part2(data, modulus=None, log2=False):
+    """
+    Count total timelines (many-worlds interpretation).
+    With modulus, return the count modulo it; with log2, return approximate log2.
+    """
     lines = [line for line in data.split("\n") if line]
 
     grid = Grid(lines)
     start_col = grid.find_start()
 
     if start_col is None:
-        return 0
+        zero, _, _ = timeline_arithmetic(modulus, log2)
+        return zero
 
     # Start with 1 timeline at row 0, S column
-    memo = {}
-    total_timelines = grid.count_timelines(0, start_col, memo)
+    total_timelines = grid.count_timelines(0, start_col, modulus, log2)
 
     return total_timelines
 
@@ -202,7 +353,42 @@ example_result_p2 = solve_part2(example_input)
 print(f"Part 2 Example: {example_result_p2}")
 print(f"Expected: 40")
 
+# %%
+# Part 2: Timelines for every entry column (one bottom-up pass)
+example_grid = Grid([line for line in example_input.split("\n") if line])
+example_by_column = example_grid.timelines_by_column()
+print(f"Timelines by entry column: {example_by_column}")
+print(f"S column: {example_by_column[example_grid.find_start()]} (expected 40)")
+
 # %%
 # Part 2: Solution
 part2_answer = solve_part2(puzzle_input)
 print(f"Part 2 Answer: {part2_answer}")
+
+# %% [markdown]
+# ## Both Parts in One Pass
+#
+# One sweep already yields both answers: the number of splitters with beams
+# on them (Part 1) and the number of timelines leaving the manifold (Part 2).
+# Parsing once and sweeping once halves the work of running both parts.
+
+
+# %%
+def solve_both(data):
+    """Return (Part 1 splits, Part 2 timelines) from one parse and one sweep."""
+    lines = [line for line in data.split("\n") if line]
+
+    # Grid finds S with str.find on the first row while parsing
+    grid = Grid(lines)
+    start_col = grid.find_start()
+
+    if start_col is None:
+        return 0, 0
+
+    return grid.sweep(0, start_col)
+
+
+# %%
+# Both parts: Example
+print(f"Both Parts Example: {solve_both(example_input)}")
+print(f"Expected: (21, 40)")
@@ -8,18 +8,22 @@
 #
 # **Algorithm:**
 # 1. Parse 3D coordinates (x, y, z)
-# 2. Calculate all pairwise Euclidean distances
-# 3. Sort pairs by distance (shortest first)
-# 4. Add first 1000 edges to NetworkX graph
-# 5. Find connected components (circuits)
+# 2. Stream all pairwise Euclidean distances
+# 3. Keep only the 1000 shortest pairs in a bounded heap (no full sort)
+# 4. Union those 1000 pairs in a disjoint-set (union-find) structure
+# 5. Read circuit sizes straight from the disjoint set
 # 6. Multiply sizes of 3 largest circuits
 
 # %%
 # Load input data
+import hashlib
+import heapq
+import mmap
 import os
-from math import sqrt
-
-import networkx as nx
+from array import array
+from bisect import bisect_left, insort
+from itertools import islice
+from math import ceil, pi, sqrt
 
 if os.path.exists("../resources/inputs/day08.txt"):
     with open("../resources/inputs/day08.txt", "r") as f:
@@ -30,6 +34,57 @@ elif os.path.exists("resources/inputs/day08.txt"):
 else:
     puzzle_input = ""  # Will be loaded when needed
 
+# %% [markdown]
+# ## Disjoint Set (Union-Find)
+#
+# Tracks which circuit each junction box belongs to.
+# Path compression and union by size make each operation near O(1),
+# and the number of circuits is kept up to date as pairs are joined.
+
+
+# %%
+class DisjointSet:
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.size = [1] * n  # Only meaningful for roots
+        self.components = n
+
+    def find(self, x):
+        """Return the root of x's circuit, compressing the path on the way."""
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+
+        while x != root:
+            next_x = self.parent[x]
+            self.parent[x] = root
+            x = next_x
+
+        return root
+
+    def union(self, a, b):
+        """
+        Join the circuits of a and b (smaller under larger).
+        Returns True if they were separate circuits, False if already joined.
+        """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        self.components -= 1
+        return True
+
+    def component_sizes(self):
+        """Return the size of every circuit."""
+        return [self.size[i] for i, parent in enumerate(self.parent) if parent == i]
+
+
 # %% [markdown]
 # ## Helper Functions
 
@@ -51,47 +106,684 @@ def euclidean_distance(box1, box2):
     return sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2)
 
 
-def calculate_all_distances(boxes):
-    """Calculate distances for all pairs of boxes."""
-    distances = []
+def iter_pair_distances(boxes):
+    """Yield (distance, i, j) for all pairs of boxes, one at a time."""
     n = len(boxes)
 
     for i in range(n):
         for j in range(i + 1, n):
-            dist = euclidean_distance(boxes[i], boxes[j])
-            distances.append((dist, i, j))
+            yield euclidean_distance(boxes[i], boxes[j]), i, j
+
+
+def calculate_all_distances(boxes, backend="python", tile_size=256):
+    """
+    Calculate distances for all pairs of boxes.
+    backend="python": list of (distance, i, j) tuples.
+    backend="numpy": (squared_distance, i, j) int64 arrays, built tile by tile.
+    """
+    if backend == "numpy":
+        return calculate_all_distances_numpy(boxes, tile_size)
+    elif backend == "python":
+        return list(iter_pair_distances(boxes))
+
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+def find_shortest_pairs(boxes, k):
+    """
+    Select the k shortest pairs, shortest first, without sorting all pairs.
+    Pairs are streamed through a bounded heap, so memory is O(k) instead of
+    O(n^2) tuples. Ties are broken by (i, j), exactly like a full sort.
+    """
+    return heapq.nsmallest(k, iter_pair_distances(boxes))
+
+
+def select_shortest_pairs(boxes, k, method="heap", cache_dir=None):
+    """
+    Select the k shortest pairs, shortest first.
+    method: "heap" (all pairs, bounded heap), "numpy" (vectorized tiles),
+    "spatial" (grid buckets) or "cache" (on-disk sorted pairs in cache_dir).
+    """
+    if method == "cache":
+        dist_sq, rows, cols = load_sorted_pairs(boxes, cache_dir)
+        k = max(k, 0)
+        return list(zip(dist_sq[:k], rows[:k], cols[:k]))
+    elif method == "numpy":
+        return find_shortest_pairs_numpy(boxes, k)
+    elif method == "spatial":
+        return find_shortest_pairs_spatial(boxes, k)
+    elif method == "heap":
+        return find_shortest_pairs(boxes, k)
+
+    raise ValueError(f"Unknown method: {method}")
+
+
+def build_graph_with_shortest_edges(
+    boxes, num_connections, method="heap", cache_dir=None
+):
+    """
+    Build circuits by connecting the num_connections shortest pairs.
+    method, cache_dir: see select_shortest_pairs.
+    Returns DisjointSet.
+    """
+    # Select the shortest pairs (shortest first)
+    distances = select_shortest_pairs(boxes, num_connections, method, cache_dir)
+
+    # Start with every box in its own circuit
+    circuits = DisjointSet(len(boxes))
+
+    # Join the shortest pairs
+    for dist, box1, box2 in distances:
+        circuits.union(box1, box2)
+
+    return circuits
+
+
+def get_circuit_sizes(circuits):
+    """Get sizes of all circuits, largest first."""
+    return sorted(circuits.component_sizes(), reverse=True)
+
+
+# %% [markdown]
+# ## Vectorized Distances (Optional NumPy Backend)
+#
+# Coordinates are loaded as an (n, 3) int64 array and squared distances are
+# computed in square tiles of the upper triangle, so the temporaries are one
+# tile rather than n^2. No sqrt: squared distances sort the same way, and
+# integers avoid float ties. (Coordinates must stay below ~10^9 so squared
+# distances fit in int64.)
+#
+# What each path keeps in memory:
+# - Part 1 (`find_shortest_pairs_numpy`): O(k + tile)
+# - `calculate_all_distances_numpy`: the output, 24 bytes per pair, filled
+#   tile by tile into preallocated arrays in (i, j) order
+# - Part 2 method="numpy": 16 bytes per pair (distances and their sort
+#   order; i and j are recovered from each pair's position). For O(n)
+#   memory use method="prim_numpy" instead
+#
+# NumPy is only imported when this backend is used.
+
+
+# %%
+def import_numpy():
+    """Import NumPy on demand; it is only needed for the numpy backend."""
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ImportError("The numpy backend needs NumPy: pip install numpy") from exc
+    return np
+
+
+def iter_distance_tiles(boxes, tile_size=256):
+    """
+    Yield (squared_distance, i, j) int64 arrays for every pair i < j,
+    one tile_size x tile_size tile of the upper triangle at a time.
+    """
+    np = import_numpy()
+    coords = np.asarray(boxes, dtype=np.int64).reshape(-1, 3)
+    n = len(coords)
+
+    for row_start in range(0, n, tile_size):
+        row_end = min(row_start + tile_size, n)
+
+        for col_start in range(row_start, n, tile_size):
+            col_end = min(col_start + tile_size, n)
+
+            dist_sq = np.zeros((row_end - row_start, col_end - col_start), np.int64)
+            for axis in range(3):
+                diff = (
+                    coords[row_start:row_end, axis, None]
+                    - coords[None, col_start:col_end, axis]
+                )
+                dist_sq += diff * diff
+
+            rows, cols = np.meshgrid(
+                np.arange(row_start, row_end),
+                np.arange(col_start, col_end),
+                indexing="ij",
+            )
+
+            if col_start == row_start:
+                # Diagonal tile: keep only the upper triangle
+                upper = rows < cols
+                yield dist_sq[upper], rows[upper], cols[upper]
+            else:
+                yield dist_sq.ravel(), rows.ravel(), cols.ravel()
+
+
+def pair_row_starts(n):
+    """
+    Return the position of pair (i, i + 1) for every i, when the pairs
+    i < j are laid out in (i, j) order. Pair (i, j) is at starts[i] + j - i - 1.
+    """
+    np = import_numpy()
+    i = np.arange(n, dtype=np.int64)
+    return i * n - i * (i + 1) // 2
+
+
+def pair_indices(row_starts, positions):
+    """Return the (i, j) arrays of the pairs at the given (i, j)-order positions."""
+    np = import_numpy()
+    rows = np.searchsorted(row_starts, positions, side="right") - 1
+    cols = positions - row_starts[rows] + rows + 1
+    return rows, cols
+
+
+def calculate_all_distances_numpy(boxes, tile_size=256):
+    """
+    Return (squared_distance, i, j) int64 arrays for all pairs in (i, j) order.
+    The arrays are preallocated and filled one tile at a time, so peak memory
+    is the output plus one tile.
+    """
+    np = import_numpy()
+    n = len(boxes)
+    row_starts = pair_row_starts(n)
+    dist_sq, rows, cols = (np.empty(n * (n - 1) // 2, np.int64) for _ in range(3))
+
+    for tile_dist, tile_rows, tile_cols in iter_distance_tiles(boxes, tile_size):
+        positions = row_starts[tile_rows] + tile_cols - tile_rows - 1
+        dist_sq[positions] = tile_dist
+        rows[positions] = tile_rows
+        cols[positions] = tile_cols
+
+    return dist_sq, rows, cols
+
+
+def find_shortest_pairs_numpy(boxes, k, tile_size=256):
+    """
+    Select the k shortest pairs, shortest first, one tile at a time.
+    Keeps the best candidates so far and trims them with np.partition after
+    each tile, so memory is O(k + tile). Candidates tied with the k-th
+    distance are kept, so (i, j) tie-breaking matches a full sort.
+    """
+    np = import_numpy()
+    if k <= 0:
+        return []
+
+    best = (np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, np.int64))
+
+    for tile in iter_distance_tiles(boxes, tile_size):
+        dist_sq, rows, cols = (np.concatenate(pair) for pair in zip(best, tile))
+
+        if len(dist_sq) > k:
+            kth = np.partition(dist_sq, k - 1)[k - 1]
+            keep = dist_sq <= kth
+            dist_sq, rows, cols = dist_sq[keep], rows[keep], cols[keep]
+
+        best = (dist_sq, rows, cols)
+
+    dist_sq, rows, cols = best
+    order = np.lexsort((cols, rows, dist_sq))[:k]
+    return list(
+        zip(dist_sq[order].tolist(), rows[order].tolist(), cols[order].tolist())
+    )
+
+
+def iter_sorted_pairs_numpy(boxes, tile_size=256, chunk_size=1 << 16):
+    """
+    Yield (squared_distance, i, j) for all pairs, shortest first.
+    Only the distances are stored, in (i, j) order, so a stable argsort
+    breaks ties by (i, j) and each pair's i and j follow from its position.
+    The sorted pairs are converted to Python ints one chunk at a time.
+    """
+    np = import_numpy()
+    n = len(boxes)
+    row_starts = pair_row_starts(n)
+    dist_sq = np.empty(n * (n - 1) // 2, np.int64)
+
+    for tile_dist, tile_rows, tile_cols in iter_distance_tiles(boxes, tile_size):
+        dist_sq[row_starts[tile_rows] + tile_cols - tile_rows - 1] = tile_dist
+
+    order = np.argsort(dist_sq, kind="stable")
+
+    for start in range(0, len(order), chunk_size):
+        positions = order[start : start + chunk_size]
+        rows, cols = pair_indices(row_starts, positions)
+        yield from zip(dist_sq[positions].tolist(), rows.tolist(), cols.tolist())
+
+
+# %% [markdown]
+# ## On-Disk Cache of Sorted Pairs
+#
+# Exploratory runs on the same input recompute and re-sort every pairwise
+# distance. method="cache" sorts the (squared_distance, i, j) pairs once and
+# stores them as three int64 files named by a hash of the coordinates.
+# Later runs memory-map those files, so any num_connections (and Part 2)
+# starts from the cached order without computing a single distance.
+#
+# The cache is built with an external sort: pairs are sorted in runs of
+# bounded size, each run is written to a temporary file, and the runs are
+# merged chunk by chunk into the column files. Memory stays at about one run
+# however many pairs there are. The files take 24 bytes per pair and are not
+# cleaned up, so cache_dir must be given explicitly.
+
+
+# %%
+PAIR_CACHE_SUFFIXES = (".dist", ".i", ".j")
+
+
+def pair_cache_key(boxes):
+    """Hash of the coordinates, used to name the cache files."""
+    flat = array("q", (coord for box in boxes for coord in box))
+    return "day08-" + hashlib.sha256(flat.tobytes()).hexdigest()[:16]
+
+
+def iter_squared_pairs(boxes):
+    """Yield (squared_distance, i, j) for all pairs i < j, one at a time."""
+    n = len(boxes)
+
+    for i in range(n):
+        xi, yi, zi = boxes[i]
+        for j in range(i + 1, n):
+            xj, yj, zj = boxes[j]
+            yield (xj - xi) ** 2 + (yj - yi) ** 2 + (zj - zi) ** 2, i, j
+
+
+def write_pair_runs(boxes, prefix, run_size):
+    """
+    Sort the pairs run_size at a time and write each sorted run to its own
+    temporary file of int64 (squared_distance, i, j) triples.
+    Returns the run file paths.
+    """
+    paths = []
+    pairs = iter_squared_pairs(boxes)
+
+    while True:
+        run = sorted(islice(pairs, run_size))
+        if not run:
+            return paths
+
+        path = f"{prefix}.run{len(paths)}.tmp"
+        with open(path, "wb") as f:
+            array("q", (value for pair in run for value in pair)).tofile(f)
+        paths.append(path)
+
+
+def read_pair_run(path, chunk_size):
+    """
+    Yield the (squared_distance, i, j) triples of a run file, chunk_size at a
+    time. The file is only open while a chunk is read, so thousands of runs
+    can be merged without running out of file handles.
+    """
+    offset = 0
+    while True:
+        chunk = array("q")
+        with open(path, "rb") as f:
+            f.seek(offset)
+            try:
+                chunk.fromfile(f, 3 * chunk_size)
+            except EOFError:
+                pass  # The last chunk is short; fromfile keeps what it read
+        if not chunk:
+            return
+
+        offset += chunk.itemsize * len(chunk)
+        yield from zip(chunk[0::3], chunk[1::3], chunk[2::3])
+
+
+def write_sorted_pairs(boxes, prefix, run_size=1 << 18):
+    """
+    Sort all pairs by (squared_distance, i, j) and write one file per column.
+    External sort: sorted runs of run_size pairs are merged, so memory stays
+    at about run_size pairs instead of all n^2 / 2.
+    """
+    runs = write_pair_runs(boxes, prefix, run_size)
+
+    try:
+        # Split the read buffers between runs so the merge holds ~run_size pairs
+        chunk_size = max(256, run_size // max(len(runs), 1))
+        merged = heapq.merge(*(read_pair_run(path, chunk_size) for path in runs))
+
+        # Write to temporary files first so a crash never leaves half a cache
+        tmp_paths = [prefix + suffix + ".tmp" for suffix in PAIR_CACHE_SUFFIXES]
+        with (
+            open(tmp_paths[0], "wb") as f_dist,
+            open(tmp_paths[1], "wb") as f_i,
+            open(tmp_paths[2], "wb") as f_j,
+        ):
+            while True:
+                chunk = list(islice(merged, chunk_size))
+                if not chunk:
+                    break
+                for column_idx, f in enumerate((f_dist, f_i, f_j)):
+                    array("q", (pair[column_idx] for pair in chunk)).tofile(f)
+
+        for tmp_path, suffix in zip(tmp_paths, PAIR_CACHE_SUFFIXES):
+            os.replace(tmp_path, prefix + suffix)
+    finally:
+        for path in runs:
+            os.remove(path)
+
+
+def map_column(path):
+    """Memory-map one cached int64 column as a read-only sequence of ints."""
+    if os.path.getsize(path) == 0:
+        return array("q")
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    # The memoryview keeps the mapping alive after the file is closed
+    return memoryview(mm).cast("q")
+
+
+def load_sorted_pairs(boxes, cache_dir=None):
+    """
+    Return (squared_distance, i, j) sequences of all pairs, shortest first.
+    Built and written to cache_dir on the first call for these coordinates;
+    later calls only memory-map the cached files.
+    """
+    if cache_dir is None:
+        raise ValueError("The cache method needs an explicit cache_dir")
+
+    prefix = os.path.join(cache_dir, pair_cache_key(boxes))
+
+    if not all(os.path.exists(prefix + suffix) for suffix in PAIR_CACHE_SUFFIXES):
+        os.makedirs(cache_dir, exist_ok=True)
+        write_sorted_pairs(boxes, prefix)
+
+    return tuple(map_column(prefix + suffix) for suffix in PAIR_CACHE_SUFFIXES)
+
+
+# %% [markdown]
+# ## Spatial Index (Uniform Grid Buckets)
+#
+# All-pairs distances are quadratic, which is infeasible for ~10^5 boxes.
+# Instead, bucket the boxes into a 3D grid with cell size = radius: any pair
+# within the radius lies in the same or a neighbouring cell, so a radius
+# query only compares boxes in the 27 surrounding cells.
+#
+# The radius starts from an estimate and doubles until the pairs found are
+# enough. Every pair closer than the radius is found, so the answer is
+# exactly the brute-force one:
+# - Part 1: at least k pairs within the radius contain the k shortest overall
+# - Part 2: if the pairs within the radius connect every box, Kruskal never
+#   needs a longer pair
+
+
+# %%
+def find_pairs_within(boxes, radius):
+    """
+    Find all pairs of boxes at most radius apart using grid buckets.
+    Returns sorted list of (squared_distance, i, j) with i < j.
+    """
+    buckets = {}
+    for idx, (x, y, z) in enumerate(boxes):
+        key = (x // radius, y // radius, z // radius)
+        buckets.setdefault(key, []).append(idx)
+
+    max_dist_sq = radius * radius
+    neighbours = [
+        (dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+    ]
+    pairs = []
+
+    for (cx, cy, cz), members in buckets.items():
+        for dx, dy, dz in neighbours:
+            others = buckets.get((cx + dx, cy + dy, cz + dz))
+            if others is None:
+                continue
+
+            # Each pair is seen from both cells; keep it only once (i < j)
+            for i in members:
+                x1, y1, z1 = boxes[i]
+                for j in others:
+                    if j <= i:
+                        continue
+                    x2, y2, z2 = boxes[j]
+                    dist_sq = (x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2
+                    if dist_sq <= max_dist_sq:
+                        pairs.append((dist_sq, i, j))
+
+    pairs.sort()
+    return pairs
+
+
+def estimate_radius(boxes, num_pairs):
+    """Radius expected to enclose about num_pairs pairs if boxes were spread evenly."""
+    n = len(boxes)
+    volume = 1
+    for axis in range(3):
+        values = [box[axis] for box in boxes]
+        volume *= max(values) - min(values) + 1
+
+    # Pairs within r ~ (n^2 / 2) * (4/3 pi r^3) / volume
+    radius_cubed = 2 * volume * num_pairs / (n * n * 4 / 3 * pi)
+    return max(1, ceil(radius_cubed ** (1 / 3)))
+
+
+def max_pair_distance_sq(boxes):
+    """Squared diagonal of the bounding box: no pair is farther apart."""
+    total = 0
+    for axis in range(3):
+        values = [box[axis] for box in boxes]
+        total += (max(values) - min(values)) ** 2
+    return total
+
+
+def find_shortest_pairs_spatial(boxes, k):
+    """
+    Select the k shortest pairs, shortest first, using radius queries.
+    Widens the radius until at least k pairs are within it.
+    """
+    n = len(boxes)
+    k = min(k, n * (n - 1) // 2)
+    if k <= 0:
+        return []
+
+    radius = estimate_radius(boxes, k)
+    max_dist_sq = max_pair_distance_sq(boxes)
+
+    while True:
+        pairs = find_pairs_within(boxes, radius)
+        if len(pairs) >= k or radius * radius >= max_dist_sq:
+            return pairs[:k]
+        radius *= 2
+
+
+def find_last_connection(num_boxes, pairs):
+    """
+    Join pairs shortest first until every box is in one circuit.
+    Returns (i, j) of the pair that completes the single circuit, or None.
+    """
+    circuits = DisjointSet(num_boxes)
+
+    for dist, box1_idx, box2_idx in pairs:
+        # Skip pairs already in the same circuit
+        if not circuits.union(box1_idx, box2_idx):
+            continue
+
+        # Check if we now have a single circuit
+        if circuits.components == 1:
+            return box1_idx, box2_idx
 
-    return distances
+    return None
 
 
-def build_graph_with_shortest_edges(boxes, num_connections):
+def find_last_connection_spatial(boxes):
     """
-    Build graph by connecting the num_connections shortest pairs.
-    Returns NetworkX graph.
+    Find the pair that completes a single circuit using radius queries.
+    Widens the radius until the pairs within it connect every box.
     """
-    # Calculate all pairwise distances
-    distances = calculate_all_distances(boxes)
+    n = len(boxes)
+    if n < 2:
+        return None
 
-    # Sort by distance (shortest first)
-    distances.sort()
+    # A few pairs per box is usually enough to connect everything
+    radius = estimate_radius(boxes, 4 * n)
+    max_dist_sq = max_pair_distance_sq(boxes)
+
+    while True:
+        last = find_last_connection(n, find_pairs_within(boxes, radius))
+        if last is not None or radius * radius >= max_dist_sq:
+            return last
+        radius *= 2
+
+
+# %% [markdown]
+# ## Dense Prim (O(n) Memory)
+#
+# Part 2's final connecting pair is the longest edge of the minimum spanning
+# tree. Prim's algorithm on the implicit complete graph finds it in O(n^2)
+# time while keeping only O(n) state: the best distance from each box to the
+# tree so far. The pair list is never built or sorted.
+#
+# Pairs are compared by (squared distance, i, j). That order has no ties, so
+# the spanning tree is unique and equals the one Kruskal builds from the
+# sorted pair list, and the answer matches exactly.
+
+
+# %%
+def find_last_connection_prim(boxes, use_numpy=False):
+    """
+    Find the pair that completes a single circuit with dense Prim.
+    Returns (i, j) of the longest spanning-tree edge, or None.
+    use_numpy: vectorize the inner loop over boxes with NumPy.
+    """
+    if len(boxes) < 2:
+        return None
+    if use_numpy:
+        return find_last_connection_prim_numpy(boxes)
+
+    n = len(boxes)
+    in_tree = [False] * n
+    best_dist = [None] * n  # squared distance from box to the tree
+    best_pair = [None] * n  # (i, j) of that closest tree edge
+    longest = None
+
+    v = 0
+    for _ in range(n - 1):
+        in_tree[v] = True
+        x1, y1, z1 = boxes[v]
+
+        # Update every box outside the tree with its distance to v
+        next_v = None
+        for u in range(n):
+            if in_tree[u]:
+                continue
+
+            x2, y2, z2 = boxes[u]
+            dist_sq = (x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2
+            pair = (v, u) if v < u else (u, v)
+            if (
+                best_dist[u] is None
+                or dist_sq < best_dist[u]
+                or (dist_sq == best_dist[u] and pair < best_pair[u])
+            ):
+                best_dist[u] = dist_sq
+                best_pair[u] = pair
+
+            # Track the closest box to add next
+            if next_v is None or (best_dist[u], best_pair[u]) < (
+                best_dist[next_v],
+                best_pair[next_v],
+            ):
+                next_v = u
+
+        edge = (best_dist[next_v], best_pair[next_v])
+        if longest is None or edge > longest:
+            longest = edge
+        v = next_v
+
+    return longest[1]
+
+
+def find_last_connection_prim_numpy(boxes):
+    """Dense Prim with a NumPy inner loop; same result as the pure-Python version."""
+    np = import_numpy()
+    coords = np.asarray(boxes, dtype=np.int64).reshape(-1, 3)
+    n = len(coords)
+    idx = np.arange(n)
+
+    in_tree = np.zeros(n, dtype=bool)
+    best_dist = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+    best_lo = np.zeros(n, dtype=np.int64)  # closest tree edge as (lo, hi)
+    best_hi = np.zeros(n, dtype=np.int64)
+    longest = None
+
+    v = 0
+    for _ in range(n - 1):
+        in_tree[v] = True
+        best_dist[v] = np.iinfo(np.int64).max
+
+        diff = coords - coords[v]
+        dist_sq = (diff * diff).sum(axis=1)
+        lo = np.minimum(idx, v)
+        hi = np.maximum(idx, v)
+
+        # Closer, or equally close with a smaller (i, j) pair
+        better = (dist_sq < best_dist) | (
+            (dist_sq == best_dist)
+            & ((lo < best_lo) | ((lo == best_lo) & (hi < best_hi)))
+        )
+        better &= ~in_tree
+        best_dist[better] = dist_sq[better]
+        best_lo[better] = lo[better]
+        best_hi[better] = hi[better]
+
+        # Closest box outside the tree, ties broken by pair
+        candidates = np.flatnonzero(~in_tree & (best_dist == best_dist[~in_tree].min()))
+        next_v = min(
+            candidates.tolist(), key=lambda u: (int(best_lo[u]), int(best_hi[u]))
+        )
+
+        edge = (int(best_dist[next_v]), int(best_lo[next_v]), int(best_hi[next_v]))
+        if longest is None or edge > longest:
+            longest = edge
+        v = next_v
+
+    return longest[1], longest[2]
+
+
+# %% [markdown]
+# ## Cross-Check with NetworkX (Optional)
+#
+# The default path needs no third-party packages: circuits come from the
+# DisjointSet above. method="networkx" rebuilds the answers from networkx
+# graphs to cross-check it. networkx is imported only when asked for, so it
+# adds nothing to the module's start-up time.
+
+
+# %%
+def import_networkx():
+    """Import networkx on demand; it is only needed for cross-checking."""
+    try:
+        import networkx as nx
+    except ImportError as exc:
+        raise ImportError(
+            "The networkx cross-check needs networkx: pip install networkx"
+        ) from exc
+    return nx
+
+
+def circuit_sizes_networkx(boxes, num_connections):
+    """Get circuit sizes (largest first) from a networkx graph of the shortest pairs."""
+    nx = import_networkx()
 
-    # Create graph with all nodes
     G = nx.Graph()
     G.add_nodes_from(range(len(boxes)))
+    G.add_edges_from((i, j) for _, i, j in find_shortest_pairs(boxes, num_connections))
+
+    return sorted((len(c) for c in nx.connected_components(G)), reverse=True)
+
 
-    # Add the shortest edges
-    for i in range(min(num_connections, len(distances))):
-        dist, box1, box2 = distances[i]
-        G.add_edge(box1, box2)
+def find_last_connection_networkx(boxes):
+    """
+    Find the pair that completes a single circuit with networkx's Kruskal.
+    Weights are ranks in the sorted pair list, so ties break as in the sort.
+    """
+    nx = import_networkx()
 
-    return G
+    G = nx.Graph()
+    G.add_nodes_from(range(len(boxes)))
+    for rank, (dist, i, j) in enumerate(sorted(iter_pair_distances(boxes))):
+        G.add_edge(i, j, weight=rank)
 
+    last = None
+    for box1_idx, box2_idx in nx.minimum_spanning_edges(
+        G, algorithm="kruskal", data=False
+    ):
+        last = (box1_idx, box2_idx)
 
-def get_circuit_sizes(G):
-    """Get sizes of all connected components (circuits)."""
-    components = nx.connected_components(G)
-    sizes = [len(component) for component in components]
-    return sorted(sizes, reverse=True)
+    return last
 
 
 # %% [markdown]
@@ -99,15 +791,25 @@ def get_circuit_sizes(G):
 
 
 # %%
-def solve_part1(data, num_connections=1000):
-    """Connect the shortest num_connections pairs and find product of 3 largest circuits."""
+def solve_part1(data, num_connections=1000, method="heap", cache_dir=None):
+    """
+    Connect the shortest num_connections pairs and find product of 3 largest circuits.
+    method: "heap" (all pairs), "numpy" (vectorized tiles),
+    "spatial" (grid buckets, for many boxes), "cache" (sorted pairs cached
+    on disk in cache_dir) or "networkx" (cross-check).
+    """
     boxes = parse_coordinates(data)
 
-    # Build graph with shortest connections
-    G = build_graph_with_shortest_edges(boxes, num_connections)
+    if method == "networkx":
+        sizes = circuit_sizes_networkx(boxes, num_connections)
+    else:
+        # Build circuits with shortest connections
+        circuits = build_graph_with_shortest_edges(
+            boxes, num_connections, method, cache_dir
+        )
 
-    # Get circuit sizes
-    sizes = get_circuit_sizes(G)
+        # Get circuit sizes
+        sizes = get_circuit_sizes(circuits)
 
     # Multiply 3 largest
     if len(sizes) >= 3:
@@ -156,45 +858,151 @@ print(f"Number of circuits: {len(part1_sizes)}")
 print(f"Three largest circuits: {part1_sizes[:3]}")
 
 # %% [markdown]
-# ## Part 2: Connect Until Single Circuit
+# ## Part 1: Every Connection Count in One Pass
+#
+# Tuning `num_connections` by calling `solve_part1` repeatedly rebuilds the
+# circuits from scratch each time. Instead, walk the sorted pairs once with
+# a DisjointSet and keep a multiset of circuit sizes (counting buckets plus
+# a sorted list of distinct sizes). Sizes add up to n, so there are at most
+# ~sqrt(2n) distinct sizes and the 3 largest are read off the end.
 
 
 # %%
-def solve_part2(data):
+class CircuitSizeCounts:
+    def __init__(self, n):
+        self.counts = {1: n} if n else {}  # circuit size -> number of circuits
+        self.distinct = [1] if n else []  # sorted distinct sizes
+
+    def add(self, size):
+        """Record a new circuit of this size."""
+        if size in self.counts:
+            self.counts[size] += 1
+        else:
+            self.counts[size] = 1
+            insort(self.distinct, size)
+
+    def remove(self, size):
+        """Forget one circuit of this size."""
+        self.counts[size] -= 1
+        if not self.counts[size]:
+            del self.counts[size]
+            del self.distinct[bisect_left(self.distinct, size)]
+
+    def largest(self, m):
+        """Return the m largest circuit sizes, largest first."""
+        sizes = []
+        for size in reversed(self.distinct):
+            take = min(self.counts[size], m - len(sizes))
+            sizes.extend([size] * take)
+            if len(sizes) == m:
+                break
+        return sizes
+
+
+def circuit_products(data, connection_counts=None, method="heap", cache_dir=None):
     """
-    Continue connecting closest pairs until all boxes are in one circuit.
-    Return product of X coordinates of the final connecting edge.
+    Product of the 3 largest circuits after each number of connections.
+    Walks the sorted pairs once instead of re-solving for every count.
+
+    connection_counts: the num_connections values wanted, or None for every
+    count from 0 up to the number of pairs.
+    method, cache_dir: see select_shortest_pairs.
+    Returns: {num_connections: product}, matching solve_part1 for each count.
     """
     boxes = parse_coordinates(data)
+    n = len(boxes)
 
-    # Calculate all pairwise distances
-    distances = calculate_all_distances(boxes)
+    if connection_counts is None:
+        wanted = list(range(n * (n - 1) // 2 + 1))
+    else:
+        wanted = sorted(set(connection_counts))
+    if not wanted:
+        return {}
 
-    # Sort by distance (shortest first)
-    distances.sort()
+    pairs = select_shortest_pairs(boxes, wanted[-1], method, cache_dir)
+    circuits = DisjointSet(n)
+    sizes = CircuitSizeCounts(n)
+    products = {}
+    joined = 0
 
-    # Create graph with all nodes
-    G = nx.Graph()
-    G.add_nodes_from(range(len(boxes)))
+    for num_connections in wanted:
+        # Join pairs up to this connection count
+        while joined < min(num_connections, len(pairs)):
+            dist, box1, box2 = pairs[joined]
+            joined += 1
 
-    # Add edges one by one until we have a single component
-    for dist, box1_idx, box2_idx in distances:
-        # Check if these boxes are already in the same component
-        if nx.has_path(G, box1_idx, box2_idx):
-            continue
+            root1, root2 = circuits.find(box1), circuits.find(box2)
+            if root1 == root2:
+                continue
+
+            size1, size2 = circuits.size[root1], circuits.size[root2]
+            circuits.union(root1, root2)
+            sizes.remove(size1)
+            sizes.remove(size2)
+            sizes.add(size1 + size2)
 
-        # Add edge
-        G.add_edge(box1_idx, box2_idx)
+        largest = sizes.largest(3)
+        products[num_connections] = (
+            largest[0] * largest[1] * largest[2] if len(largest) == 3 else 0
+        )
+
+    return products
+
+
+# %%
+# Part 1: Example for several connection counts at once
+example_products = circuit_products(example_input, [5, 10, 20])
+print(f"Products by connection count: {example_products}")
+print(f"Expected at 10: 40")
+
+# %% [markdown]
+# ## Part 2: Connect Until Single Circuit
+
+
+# %%
+def solve_part2(data, method="sort", cache_dir=None):
+    """
+    Continue connecting closest pairs until all boxes are in one circuit.
+    Return product of X coordinates of the final connecting edge.
+    method: "sort" (all pairs), "numpy" (vectorized tiles),
+    "spatial" (grid buckets, for many boxes), "prim" / "prim_numpy"
+    (dense Prim, O(n) memory), "cache" (sorted pairs cached on disk in
+    cache_dir) or "networkx" (cross-check).
+    """
+    boxes = parse_coordinates(data)
+
+    if method == "cache":
+        pairs = zip(*load_sorted_pairs(boxes, cache_dir))
+        last = find_last_connection(len(boxes), pairs)
+    elif method == "networkx":
+        last = find_last_connection_networkx(boxes)
+    elif method == "prim":
+        last = find_last_connection_prim(boxes)
+    elif method == "prim_numpy":
+        last = find_last_connection_prim(boxes, use_numpy=True)
+    elif method == "numpy":
+        last = find_last_connection(len(boxes), iter_sorted_pairs_numpy(boxes))
+    elif method == "spatial":
+        last = find_last_connection_spatial(boxes)
+    elif method == "sort":
+        # Calculate all pairwise distances
+        distances = calculate_all_distances(boxes)
+
+        # Sort by distance (shortest first)
+        distances.sort()
+
+        last = find_last_connection(len(boxes), distances)
+    else:
+        raise ValueError(f"Unknown method: {method}")
 
-        # Check if we now have a single component
-        num_components = nx.number_connected_components(G)
-        if num_components == 1:
-            # This is the final edge!
-            x1 = boxes[box1_idx][0]
-            x2 = boxes[box2_idx][0]
-            return x1 * x2
+    if last is None:
+        return 0
 
-    return 0
+    # This is the final edge!
+    box1_idx, box2_idx = last
+    x1 = boxes[box1_idx][0]
+    x2 = boxes[box2_idx][0]
+    return x1 * x2
 
 
 # %%
@@ -0,0 +1,132 @@
+import math
+import random
+
+import pytest
+
+from solutions.day06 import (
+    parse_vertical_problems,
+    product_tree,
+    solve_part1,
+    solve_part1_from_file,
+    solve_part2,
+    solve_part2_from_file,
+)
+
+# Example data from problem description
+EXAMPLE_INPUT = """123 328  51 64
+ 45 64  387 23
+  6 98  215 314
+*   +   *   +  """
+
+EXPECTED_PART1 = 4277556  # Sum of problems read row by row
+EXPECTED_PART2 = 3263827  # Sum of problems read as vertical numbers
+
+
+def random_worksheet(rng, num_problems, num_rows=4):
+    """
+    Build a worksheet of random problems, each 1-4 columns wide.
+    The widest number fills its problem, so only separators are blank columns.
+    """
+    blocks = []
+    for _ in range(num_problems):
+        width = rng.randint(1, 4)
+        # Sorted lengths keep each vertical number's digits contiguous
+        lengths = [rng.randint(1, width) for _ in range(num_rows - 1)] + [width]
+        lengths.sort(reverse=rng.random() < 0.5)
+        numbers = [str(rng.randint(10 ** (k - 1), 10**k - 1)) for k in lengths]
+        if rng.random() < 0.5:
+            column = [number.rjust(width) for number in numbers]
+        else:
+            column = [number.ljust(width) for number in numbers]
+        column.append(rng.choice("+*").ljust(width))
+        blocks.append(column)
+    return "\n".join(
+        " ".join(block[row] for block in blocks) for row in range(num_rows + 1)
+    )
+
+
+@pytest.fixture
+def example_file(tmp_path):
+    """The example worksheet written to a file."""
+    path = tmp_path / "day06.txt"
+    path.write_text(EXAMPLE_INPUT + "\n")
+    return path
+
+
+class TestDay06:
+    """Tests for Day 6: Trash Compactor."""
+
+    def test_part1_example(self):
+        """Test Part 1 with example input.
+
+        Problems read row by row:
+        - 123 * 45 * 6 = 33210
+        - 328 + 64 + 98 = 490
+        - 51 * 387 * 215 = 4243455
+        - 64 + 23 + 314 = 401
+        Total: 4277556
+        """
+        result = solve_part1(EXAMPLE_INPUT)
+        assert result == EXPECTED_PART1, f"Expected {EXPECTED_PART1}, got {result}"
+
+    def test_part2_example(self):
+        """Test Part 2 with example input.
+
+        Problems read as vertical numbers (order doesn't matter):
+        - 1 * 24 * 356 = 8544
+        - 369 + 248 + 8 = 625
+        - 32 * 581 * 175 = 3253600
+        - 623 + 431 + 4 = 1058
+        Total: 3263827
+        """
+        result = solve_part2(EXAMPLE_INPUT)
+        assert result == EXPECTED_PART2, f"Expected {EXPECTED_PART2}, got {result}"
+
+    def test_product_tree(self):
+        """Balanced product matches a left-to-right product."""
+        rng = random.Random(6)
+        for size in range(12):
+            numbers = [rng.randint(1, 10**6) for _ in range(size)]
+            assert product_tree(numbers) == math.prod(numbers)
+
+    def test_parse_vertical_problems(self):
+        """Columns become vertical numbers, split at blank columns."""
+        lines = EXAMPLE_INPUT.split("\n")
+        width = max(len(line) for line in lines)
+        rows = [line.ljust(width).encode() for line in lines]
+        assert parse_vertical_problems(rows) == [
+            ([1, 24, 356], "*"),
+            ([369, 248, 8], "+"),
+            ([32, 581, 175], "*"),
+            ([623, 431, 4], "+"),
+        ]
+
+    def test_part1_from_file_example(self, example_file):
+        """Test Part 1 streamed from a file, serially and in a pool."""
+        assert solve_part1_from_file(example_file) == EXPECTED_PART1
+        assert solve_part1_from_file(example_file, workers=2) == EXPECTED_PART1
+
+    @pytest.mark.parametrize("block_width", [1, 2, 3, 1 << 16])
+    def test_part2_from_file_example(self, example_file, block_width):
+        """Blocks narrower than a problem carry it over to the next block."""
+        assert solve_part2_from_file(example_file, block_width) == EXPECTED_PART2
+        result = solve_part2_from_file(example_file, block_width, workers=2)
+        assert result == EXPECTED_PART2
+
+    def test_from_file_random(self, tmp_path):
+        """Random worksheets give the same totals from memory and from a file."""
+        rng = random.Random(2025)
+        path = tmp_path / "worksheet.txt"
+        for _ in range(40):
+            data = random_worksheet(rng, rng.randint(1, 30), rng.randint(1, 5))
+            path.write_text(data + "\n")
+            block_width = rng.randint(1, 20)
+
+            expected1, expected2 = solve_part1(data), solve_part2(data)
+            assert solve_part1_from_file(path) == expected1
+            assert solve_part2_from_file(path, block_width) == expected2
+
+            workers = rng.randint(2, 4)
+            assert solve_part1_from_file(path, workers=workers) == expected1
+            result = solve_part2_from_file(path, block_width, workers=workers)
+            assert result == expected2
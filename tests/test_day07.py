@@ -0,0 +1,125 @@
+import math
+import random
+
+import pytest
+
+from solutions.day07 import Grid, solve_both, solve_part1, solve_part2
+
+# Example data from problem description
+EXAMPLE_INPUT = """.......S.......
+...............
+.......^.......
+...............
+......^.^......
+...............
+.....^.^.^.....
+...............
+....^.^...^....
+...............
+...^.^...^.^...
+...............
+..^...^.....^..
+...............
+.^.^.^.^.^...^.
+..............."""
+
+EXPECTED_PART1 = 21  # Unique splitters hit by the beam
+EXPECTED_PART2 = 40  # Timelines leaving the manifold
+
+
+def random_manifold(rng, width, height):
+    """Build a random manifold; splitters are never side by side in a row."""
+    lines = []
+    for row in range(height):
+        line = ["."] * width
+        if row % 2 == 0 and row > 0:
+            col = rng.randint(0, 2)
+            while col < width:
+                if rng.random() < 0.4:
+                    line[col] = "^"
+                col += rng.randint(2, 4)
+        lines.append(line)
+    lines[0][rng.randrange(width)] = "S"
+    return "\n".join("".join(line) for line in lines)
+
+
+def simulate(data):
+    """Reference: move every beam down one row at a time."""
+    lines = data.split("\n")
+    beams = {lines[0].index("S"): 1}
+    splits = 0
+    exited = 0
+    for line in lines[1:]:
+        moved = {}
+        for col, count in beams.items():
+            if line[col] != "^":
+                moved[col] = moved.get(col, 0) + count
+                continue
+            splits += 1
+            for side in (col - 1, col + 1):
+                if 0 <= side < len(line):
+                    moved[side] = moved.get(side, 0) + count
+                else:
+                    exited += count
+        beams = moved
+    return splits, exited + sum(beams.values())
+
+
+class TestDay07:
+    """Tests for Day 7: Laboratories."""
+
+    @pytest.mark.parametrize("bitwise", [False, True])
+    def test_part1_example(self, bitwise):
+        """Test Part 1 with example input, with and without the bitwise sweep."""
+        result = solve_part1(EXAMPLE_INPUT, bitwise=bitwise)
+        assert result == EXPECTED_PART1, f"Expected {EXPECTED_PART1}, got {result}"
+
+    def test_part2_example(self):
+        """Test Part 2 with example input."""
+        result = solve_part2(EXAMPLE_INPUT)
+        assert result == EXPECTED_PART2, f"Expected {EXPECTED_PART2}, got {result}"
+
+    @pytest.mark.parametrize("modulus", [7, 1_000_000_007])
+    def test_part2_example_modulus(self, modulus):
+        """Modular counts equal the exact count modulo the modulus."""
+        assert solve_part2(EXAMPLE_INPUT, modulus=modulus) == EXPECTED_PART2 % modulus
+
+    def test_part2_example_log2(self):
+        """The log2 mode approximates log2 of the exact count."""
+        result = solve_part2(EXAMPLE_INPUT, log2=True)
+        assert result == pytest.approx(math.log2(EXPECTED_PART2))
+
+    def test_part2_modulus_and_log2(self):
+        """Asking for both counting modes is an error."""
+        with pytest.raises(ValueError):
+            solve_part2(EXAMPLE_INPUT, modulus=7, log2=True)
+
+    def test_both_example(self):
+        """Test both parts from one sweep."""
+        assert solve_both(EXAMPLE_INPUT) == (EXPECTED_PART1, EXPECTED_PART2)
+
+    def test_timelines_by_column_example(self):
+        """Every entry column matches a separate count_timelines sweep."""
+        grid = Grid([line for line in EXAMPLE_INPUT.split("\n") if line])
+        by_column = grid.timelines_by_column()
+        assert by_column[grid.find_start()] == EXPECTED_PART2
+        assert by_column == [grid.count_timelines(0, col) for col in range(grid.width)]
+
+    def test_random_manifolds(self):
+        """All sweeps agree with a row-by-row simulation on random manifolds."""
+        rng = random.Random(2025)
+        for _ in range(50):
+            data = random_manifold(rng, rng.randint(1, 40), rng.randint(1, 30))
+            grid = Grid(data.split("\n"))
+
+            splits, timelines = simulate(data)
+            assert solve_both(data) == (splits, timelines)
+            assert solve_part1(data) == splits
+            assert solve_part1(data, bitwise=True) == splits
+            assert solve_part2(data) == timelines
+            assert solve_part2(data, modulus=97) == timelines % 97
+
+            by_column = grid.timelines_by_column()
+            assert by_column[grid.find_start()] == timelines
+            for col in range(grid.width):
+                assert by_column[col] == grid.count_timelines(0, col)
@@ -0,0 +1,81 @@
+import pytest
+
+from solutions.day08 import circuit_products, solve_part1, solve_part2
+
+# Example data from problem description
+EXAMPLE_INPUT = """162,817,812
+57,618,57
+906,360,560
+592,479,940
+352,342,300
+466,668,158
+542,29,236
+431,825,988
+739,650,466
+52,470,668
+216,146,977
+819,987,18
+117,168,530
+805,96,715
+346,949,466
+970,615,88
+941,993,340
+862,61,35
+984,92,344
+425,690,689"""
+
+EXPECTED_PART1 = 40  # Product of the three largest circuits (5 * 4 * 2) after 10
+EXPECTED_PART2 = 25272  # Product of X coordinates of the last connection (216 * 117)
+
+
+PART1_METHODS = ["heap", "spatial", "cache", "numpy", "networkx"]
+PART2_METHODS = ["sort", "prim", "spatial", "cache", "numpy", "prim_numpy", "networkx"]
+
+# Optional packages needed by some methods
+METHOD_DEPENDENCIES = {"numpy": "numpy", "prim_numpy": "numpy", "networkx": "networkx"}
+
+
+def skip_without_dependency(method):
+    """Skip the test if the method's optional package is not installed."""
+    if method in METHOD_DEPENDENCIES:
+        pytest.importorskip(METHOD_DEPENDENCIES[method])
+
+
+class TestDay08:
+    """Tests for Day 8: Playground."""
+
+    @pytest.mark.parametrize("method", PART1_METHODS)
+    def test_part1_example(self, method, tmp_path):
+        """Test Part 1 with example input after the 10 shortest connections."""
+        skip_without_dependency(method)
+        result, sizes = solve_part1(
+            EXAMPLE_INPUT, num_connections=10, method=method, cache_dir=tmp_path
+        )
+        assert result == EXPECTED_PART1, f"Expected {EXPECTED_PART1}, got {result}"
+        assert len(sizes) == 11
+
+    @pytest.mark.parametrize("method", PART2_METHODS)
+    def test_part2_example(self, method, tmp_path):
+        """Test Part 2 with example input for each method."""
+        skip_without_dependency(method)
+        result = solve_part2(EXAMPLE_INPUT, method=method, cache_dir=tmp_path)
+        assert result == EXPECTED_PART2, f"Expected {EXPECTED_PART2}, got {result}"
+
+    def test_part2_example_cache(self, tmp_path):
+        """Test Part 2 with example input, building and then reusing the cache."""
+        for _ in range(2):
+            result = solve_part2(EXAMPLE_INPUT, method="cache", cache_dir=tmp_path)
+            assert result == EXPECTED_PART2, f"Expected {EXPECTED_PART2}, got {result}"
+
+    def test_circuit_products_example(self):
+        """Test the one-pass products with the Part 1 example count."""
+        assert circuit_products(EXAMPLE_INPUT, [10]) == {10: EXPECTED_PART1}
+
+    @pytest.mark.parametrize("method", ["heap", "spatial"])
+    def test_circuit_products_match_part1(self, method):
+        """Every connection count matches a separate solve_part1 run."""
+        products = circuit_products(EXAMPLE_INPUT, method=method)
+        assert len(products) == 20 * 19 // 2 + 1
+        for num_connections, product in products.items():
+            result, _ = solve_part1(EXAMPLE_INPUT, num_connections=num_connections)
+            assert product == result, num_connections
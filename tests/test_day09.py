@@ -0,0 +1,220 @@
+import itertools
+import random
+
+import pytest
+
+from solutions.day09 import (
+    CompressedGrid,
+    EdgeIndex,
+    SpanRegion,
+    calculate_rectangle_area,
+    find_largest_pair_numpy,
+    is_point_inside_polygon,
+    iter_pairs_by_area,
+    parse_tiles,
+    solve_part1,
+    solve_part2,
+)
+
+# Example data from problem description
+EXAMPLE_INPUT = """7,1
+11,1
+11,7
+9,7
+9,5
+2,5
+2,3
+7,3"""
+
+EXPECTED_PART1 = 50  # Largest rectangle with any two red tiles as corners
+EXPECTED_PART2 = 24  # Largest rectangle of red and green tiles only
+
+# Notch one column wide: edges at x=4 and x=5 leave no outside tiles,
+# so the whole bounding box is red or green
+VERTICAL_SLIT = [(0, 0), (4, 0), (4, 4), (5, 4), (5, 0), (10, 0), (10, 6), (0, 6)]
+
+# The same with rows: edges at y=4 and y=5
+HORIZONTAL_SLIT = [(0, 0), (6, 0), (6, 4), (2, 4), (2, 5), (6, 5), (6, 10), (0, 10)]
+
+# Two one-column notches
+COMB = [
+    (0, 0),
+    (2, 0),
+    (2, 3),
+    (3, 3),
+    (3, 0),
+    (6, 0),
+    (6, 3),
+    (7, 3),
+    (7, 0),
+    (9, 0),
+    (9, 5),
+    (0, 5),
+]
+
+# Notch two columns wide: column x=5 is outside down to row 3
+WIDE_NOTCH = [(0, 0), (4, 0), (4, 4), (6, 4), (6, 0), (10, 0), (10, 6), (0, 6)]
+
+POLYGONS = [
+    parse_tiles(EXAMPLE_INPUT),
+    VERTICAL_SLIT,
+    HORIZONTAL_SLIT,
+    COMB,
+    WIDE_NOTCH,
+]
+
+METHODS = ["grid", "spans", "edges"]
+
+# Point sets for the extreme-points Part 1 search
+STAIRCASE_CASES = [
+    [(3, 3)],  # single tile: no pair
+    [(1, 1), (1, 1)],  # duplicates only
+    [(1, 1), (1, 1), (4, 3), (4, 3)],
+    [(0, 5), (3, 5), (9, 5)],  # collinear, horizontal
+    [(2, 0), (2, 7), (2, 3)],  # collinear, vertical
+    [(0, 0), (2, 2), (5, 5), (9, 9)],  # collinear, diagonal
+    [(0, 9), (4, 5), (9, 0)],  # collinear, anti-diagonal
+    [(0, 0), (10, 1), (1, 10), (9, 9)],
+    [(0, 9), (10, 8), (1, 0), (9, 1)],  # the same mirrored in y
+]
+
+
+def to_input(tiles):
+    """Format tiles as puzzle input."""
+    return "\n".join(f"{x},{y}" for x, y in tiles)
+
+
+def brute_force_valid(tiles, tile1, tile2):
+    """Check every tile of the rectangle with per-tile ray casting."""
+    (x1, y1), (x2, y2) = tile1, tile2
+    return all(
+        is_point_inside_polygon((x, y), tiles)
+        for x in range(min(x1, x2), max(x1, x2) + 1)
+        for y in range(min(y1, y2), max(y1, y2) + 1)
+    )
+
+
+class TestDay09:
+    """Tests for Day 9: Movie Theater."""
+
+    def test_part1_example(self):
+        """Test Part 1 with example input."""
+        result = solve_part1(EXAMPLE_INPUT)
+        assert result == EXPECTED_PART1, f"Expected {EXPECTED_PART1}, got {result}"
+
+    @pytest.mark.parametrize("method", METHODS)
+    def test_part2_example(self, method):
+        """Test Part 2 with example input for each validity check."""
+        result = solve_part2(EXAMPLE_INPUT, method=method)
+        assert result == EXPECTED_PART2, f"Expected {EXPECTED_PART2}, got {result}"
+
+    @pytest.mark.parametrize("method", METHODS)
+    @pytest.mark.parametrize(
+        "tiles, expected", [(VERTICAL_SLIT, 77), (HORIZONTAL_SLIT, 77), (COMB, 60)]
+    )
+    def test_part2_slits(self, method, tiles, expected):
+        """Edges one column (or row) apart enclose no outside tiles."""
+        assert solve_part2(to_input(tiles), method=method) == expected
+
+    @pytest.mark.parametrize("tiles", POLYGONS)
+    def test_region_matches_brute_force(self, tiles):
+        """Span region membership matches per-tile ray casting."""
+        region = SpanRegion.from_polygon(tiles)
+        xs = [x for x, _ in tiles]
+        ys = [y for _, y in tiles]
+        for x in range(min(xs) - 1, max(xs) + 2):
+            for y in range(min(ys) - 1, max(ys) + 2):
+                assert ((x, y) in region) == is_point_inside_polygon((x, y), tiles)
+
+    @pytest.mark.parametrize("tiles", POLYGONS)
+    def test_rectangle_checks_match_brute_force(self, tiles):
+        """Every validity check agrees with brute force on every red-tile pair."""
+        checks = [
+            CompressedGrid(tiles).is_rectangle_valid,
+            SpanRegion.from_polygon(tiles).covers_rectangle,
+            EdgeIndex(tiles).is_rectangle_valid,
+        ]
+        best = 0
+        for tile1, tile2 in itertools.combinations(tiles, 2):
+            expected = brute_force_valid(tiles, tile1, tile2)
+            for is_rectangle_valid in checks:
+                assert is_rectangle_valid(tile1, tile2) == expected, (tile1, tile2)
+            if expected:
+                best = max(best, calculate_rectangle_area(tile1, tile2))
+
+        for method in METHODS:
+            assert solve_part2(to_input(tiles), method=method) == best
+
+    def test_part1_extremes_example(self):
+        """Test Part 1 extreme-points search with example input."""
+        result = solve_part1(EXAMPLE_INPUT, method="extremes")
+        assert result == EXPECTED_PART1, f"Expected {EXPECTED_PART1}, got {result}"
+
+    @pytest.mark.parametrize("tiles", STAIRCASE_CASES)
+    def test_part1_extremes_edge_cases(self, tiles):
+        """Duplicates, collinear and mirrored points match all pairs."""
+        for sx, sy in [(1, 1), (-1, 1), (1, -1), (-1, -1)]:
+            data = to_input([(sx * x + 20, sy * y + 20) for x, y in tiles])
+            assert solve_part1(data, method="extremes") == solve_part1(data)
+
+    def test_part1_extremes_random(self):
+        """Random point sets, including many duplicates, match all pairs."""
+        rng = random.Random(2025)
+        for _ in range(300):
+            size = rng.choice([3, 20, 100_000])
+            tiles = [
+                (rng.randint(0, size), rng.randint(0, size))
+                for _ in range(rng.randint(1, 40))
+            ]
+            data = to_input(tiles)
+            assert solve_part1(data, method="extremes") == solve_part1(data), data
+
+    @pytest.mark.parametrize("method", METHODS)
+    @pytest.mark.parametrize("tiles", POLYGONS)
+    def test_part2_largest_first(self, method, tiles):
+        """Largest-first search gives the same answer as the full loop."""
+        data = to_input(tiles)
+        expected = solve_part2(data, method=method)
+        assert solve_part2(data, method=method, largest_first=True) == expected
+
+    def test_iter_pairs_by_area(self):
+        """Lazy generation yields every pair once, largest area first."""
+        rng = random.Random(9)
+        for _ in range(100):
+            size = rng.choice([3, 30, 100_000])
+            tiles = [
+                (rng.randint(0, size), rng.randint(0, size))
+                for _ in range(rng.randint(0, 30))
+            ]
+            pairs = list(iter_pairs_by_area(tiles))
+            areas = [area for area, _, _ in pairs]
+            assert areas == sorted(areas, reverse=True)
+            assert sorted(pairs) == sorted(
+                (calculate_rectangle_area(tile1, tile2), tile1, tile2)
+                for tile1, tile2 in itertools.combinations(tiles, 2)
+            )
+
+    def test_part1_numpy_example(self):
+        """Test Part 1 NumPy backend with example input."""
+        pytest.importorskip("numpy")
+        result = solve_part1(EXAMPLE_INPUT, method="numpy")
+        assert result == EXPECTED_PART1, f"Expected {EXPECTED_PART1}, got {result}"
+
+    @pytest.mark.parametrize("tile_size", [1, 3, 256])
+    def test_part1_numpy_random(self, tile_size):
+        """NumPy tiles match all pairs, from one diagonal tile to many tiles."""
+        pytest.importorskip("numpy")
+        rng = random.Random(tile_size)
+        for _ in range(100):
+            size = rng.choice([3, 20, 100_000])
+            tiles = [
+                (rng.randint(0, size), rng.randint(0, size))
+                for _ in range(rng.randint(1, 40))
+            ]
+            area, i, j = find_largest_pair_numpy(tiles, tile_size)
+            assert area == solve_part1(to_input(tiles))
+            if len(tiles) < 2:
+                assert (area, i, j) == (0, None, None)
+            else:
+                assert i < j
+                assert calculate_rectangle_area(tiles[i], tiles[j]) == area